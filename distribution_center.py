@@ -1,11 +1,233 @@
+import re
 import sqlite3
+import sys
 import random
-import string
+import time
+import queue
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, List, Tuple
 import os
 
 
+# Whole schema in one script: executescript runs it in a single
+# round-trip instead of a prepare/step/finalize per statement.
+_SCHEMA_DDL = """
+    CREATE TABLE IF NOT EXISTS Categories (
+        category_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        category_name VARCHAR(50) UNIQUE NOT NULL,
+        description TEXT,
+        zone VARCHAR(10) NOT NULL,
+        max_weight REAL,
+        priority_level INTEGER,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    CREATE TABLE IF NOT EXISTS Locations (
+        location_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        location_code VARCHAR(20) UNIQUE NOT NULL,
+        zone VARCHAR(10) NOT NULL,
+        aisle INTEGER NOT NULL,
+        shelf INTEGER NOT NULL,
+        category_id INTEGER,
+        is_occupied BOOLEAN DEFAULT 0,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (category_id) REFERENCES Categories(category_id)
+    );
+
+    CREATE TABLE IF NOT EXISTS Packages (
+        package_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        barcode VARCHAR(50) UNIQUE NOT NULL,
+        weight REAL NOT NULL,
+        length REAL NOT NULL,
+        width REAL NOT NULL,
+        height REAL NOT NULL,
+        destination VARCHAR(100) NOT NULL,
+        priority VARCHAR(20) NOT NULL,
+        category_id INTEGER NOT NULL,
+        location_id INTEGER,
+        location_code VARCHAR(20),
+        status VARCHAR(20) DEFAULT 'Received',
+        received_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (category_id) REFERENCES Categories(category_id),
+        FOREIGN KEY (location_id) REFERENCES Locations(location_id)
+    );
+
+    CREATE TABLE IF NOT EXISTS AuditTrail (
+        audit_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        package_id INTEGER NOT NULL,
+        action VARCHAR(50) NOT NULL,
+        old_status VARCHAR(20),
+        new_status VARCHAR(20),
+        old_location VARCHAR(20),
+        new_location VARCHAR(20),
+        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        notes TEXT,
+        FOREIGN KEY (package_id) REFERENCES Packages(package_id)
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_packages_barcode ON Packages(barcode);
+    CREATE INDEX IF NOT EXISTS idx_packages_category ON Packages(category_id);
+    CREATE INDEX IF NOT EXISTS idx_locations_zone ON Locations(zone);
+
+    -- Foreign-key and sort-order indexes for the JOIN-heavy paths
+    CREATE INDEX IF NOT EXISTS idx_packages_location ON Packages(location_id);
+    CREATE INDEX IF NOT EXISTS idx_audit_package ON AuditTrail(package_id);
+    CREATE INDEX IF NOT EXISTS idx_audit_timestamp ON AuditTrail(timestamp DESC);
+
+    -- Partial index over free slots only: the B-tree stays small as
+    -- the warehouse fills (replaces the old composite index)
+    DROP INDEX IF EXISTS idx_locations_cat_free;
+    CREATE INDEX IF NOT EXISTS idx_locations_free
+    ON Locations(category_id) WHERE is_occupied = 0;
+"""
+
+# Hot-path SQL hoisted to module level: passing the identical string
+# object on every call lets sqlite3's internal statement cache hit
+# reliably instead of re-parsing the query text.
+_SQL_FIND_LOCATION = """
+    SELECT location_id FROM Locations
+    WHERE category_id = ? AND is_occupied = 0
+    LIMIT 1
+"""
+
+_SQL_CLAIM_LOCATION = """
+    UPDATE Locations SET is_occupied = 1
+    WHERE location_id = (
+        SELECT location_id FROM Locations
+        WHERE category_id = ? AND is_occupied = 0
+        LIMIT 1
+    )
+    RETURNING location_id, location_code
+"""
+
+_SQL_INSERT_PACKAGE = """
+    INSERT INTO Packages
+    (barcode, weight, length, width, height, destination,
+     priority, category_id, location_id, location_code)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_AUDIT_REGISTER = """
+    INSERT INTO AuditTrail
+    (package_id, action, new_status, new_location, notes)
+    VALUES (?, 'REGISTERED', 'Received', ?, ?)
+"""
+
+# location_code is denormalized onto Packages at registration time and
+# category names resolve through PackageManager's in-memory cache, so
+# the lookup is a single-table index seek with no JOINs.
+_SQL_SEARCH_PACKAGE = """
+    SELECT
+        package_id, barcode, weight,
+        length || 'x' || width || 'x' || height AS dimensions,
+        destination, priority, status, received_at,
+        category_id, location_code AS location
+    FROM Packages
+    WHERE barcode = ?
+"""
+
+_SQL_GET_STATUS = """
+    SELECT package_id, status FROM Packages WHERE barcode = ?
+"""
+
+_SQL_UPDATE_STATUS = """
+    UPDATE Packages SET status = ? WHERE barcode = ?
+"""
+
+_SQL_FREE_LOCATION = """
+    UPDATE Locations SET is_occupied = 0
+    WHERE location_id = (
+        SELECT location_id FROM Packages WHERE barcode = ?
+    )
+"""
+
+_SQL_INSERT_AUDIT_STATUS = """
+    INSERT INTO AuditTrail
+    (package_id, action, old_status, new_status, notes)
+    VALUES (?, 'STATUS_UPDATE', ?, ?, ?)
+"""
+
+# The three small report aggregates share one round-trip; the tag
+# column tells Python which section each row belongs to, and the two
+# extra columns are only populated for the zone rows.
+_SQL_SUMMARY_AGGREGATES = """
+    SELECT 'category' AS tag, category_id AS key,
+           COUNT(*) AS n, NULL AS occupied, NULL AS rate
+    FROM Packages
+    GROUP BY category_id
+    UNION ALL
+    SELECT 'status', status, COUNT(*), NULL, NULL
+    FROM Packages
+    WHERE status IN ('Received', 'Stored', 'In Transit', 'Delivered')
+    GROUP BY status
+    UNION ALL
+    SELECT 'zone', zone, COUNT(*),
+           SUM(CASE WHEN is_occupied = 1 THEN 1 ELSE 0 END),
+           ROUND(SUM(CASE WHEN is_occupied = 1 THEN 1 ELSE 0 END) * 100.0 / COUNT(*), 2)
+    FROM Locations
+    GROUP BY zone
+"""
+
+_SQL_RECENT_ACTIVITIES = """
+    SELECT
+        p.barcode,
+        a.action,
+        a.timestamp,
+        a.notes
+    FROM AuditTrail a
+    JOIN Packages p ON a.package_id = p.package_id
+    ORDER BY a.timestamp DESC
+    LIMIT 10
+"""
+
+# How long a cached search_package result stays valid. Interactive
+# flows tend to re-search the same barcode within a few seconds
+# (status check -> update -> re-check), and writes invalidate eagerly.
+_SEARCH_CACHE_TTL = 5.0
+
+# Priority values that map straight to a category, keyed lowercase.
+_PRIORITY_CATEGORIES = {
+    'express': (2, 'Express'),
+}
+
+# Compiled once; the IGNORECASE flag replaces lower-casing the whole
+# destination string on every categorization.
+_INTL_RE = re.compile(r'international', re.IGNORECASE)
+
+
+@lru_cache(maxsize=2048)
+def _categorize(weight: float, priority_l: str,
+                destination: str) -> Tuple[int, str]:
+    """Category decision for one package profile (priority lowercased).
+
+    Bulk imports tend to repeat the same (weight, priority, destination)
+    profiles, so memoizing turns the repeat calls into a hash lookup.
+    The five categories are static, so the cache never goes stale.
+    """
+    # Express priority
+    category = _PRIORITY_CATEGORIES.get(priority_l)
+    if category:
+        return category
+
+    # International destination
+    if _INTL_RE.search(destination) or destination.count(',') > 1:
+        return (5, 'International')
+
+    # Heavy items
+    if weight > 50.0:
+        return (4, 'Heavy')
+
+    # Fragile items (can be detected by keywords or external input)
+    # For this example, we'll use a simple check
+    if weight < 5.0:
+        return (3, 'Fragile')
+
+    # Default to Standard
+    return (1, 'Standard')
+
+
 class DistributionCenterDB:
     """Database manager for the distribution center package management system."""
     
@@ -13,103 +235,122 @@ class DistributionCenterDB:
         self.db_name = db_name
         self.conn = None
         self.cursor = None
-        
+        self._reader_pool = None
+
     def connect(self):
-        """Establish database connection."""
-        self.conn = sqlite3.connect(self.db_name)
+        """Open the writer connection and a pool of reader connections."""
+        self.conn = sqlite3.connect(self.db_name, check_same_thread=False,
+                                    cached_statements=256)
+        # Autocommit mode: transactions are opened explicitly with
+        # BEGIN IMMEDIATE in writer() instead of sqlite3's implicit
+        # deferred BEGIN, which can fail with SQLITE_BUSY mid-transaction.
+        self.conn.isolation_level = None
+        # Name-indexed rows avoid positional result[i] bookkeeping in
+        # the lookup paths; Row still unpacks like a tuple elsewhere.
+        self.conn.row_factory = sqlite3.Row
         self.cursor = self.conn.cursor()
-        self.conn.execute("PRAGMA foreign_keys = ON")
-        
+        self._apply_pragmas(self.conn)
+
+        # Under WAL, readers do not block the writer and vice versa, so
+        # reads can run on their own connections while self.conn stays
+        # dedicated to writes. A :memory: database is private to each
+        # connection, so reads fall back to the writer connection there.
+        if self.db_name != ":memory:":
+            self._reader_pool = queue.Queue()
+            for _ in range(os.cpu_count() or 1):
+                reader = sqlite3.connect(self.db_name, check_same_thread=False,
+                                         cached_statements=256)
+                reader.isolation_level = None
+                reader.row_factory = sqlite3.Row
+                self._apply_pragmas(reader)
+                self._reader_pool.put(reader)
+
+    def _apply_pragmas(self, conn):
+        """Apply the tuned PRAGMA set to a connection."""
+        conn.execute("PRAGMA foreign_keys = ON")
+        if self.db_name != ":memory:":
+            # WAL lets readers run while a writer commits, and NORMAL
+            # synchronous halves the fsyncs per commit (safe under WAL).
+            conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA cache_size=-20000")  # 20MB page cache
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+
+    @contextmanager
+    def reader(self):
+        """Borrow a connection from the reader pool for a query."""
+        if self._reader_pool is None:
+            yield self.conn
+            return
+        conn = self._reader_pool.get()
+        try:
+            yield conn
+        finally:
+            self._reader_pool.put(conn)
+
+    @contextmanager
+    def writer(self):
+        """Run a write transaction on the dedicated writer connection.
+
+        BEGIN IMMEDIATE takes the write lock upfront so the transaction
+        cannot hit SQLITE_BUSY halfway through. If another process holds
+        the lock, acquiring it is retried with exponential backoff for
+        roughly the busy_timeout window before giving up.
+        """
+        delay = 0.001
+        deadline = time.monotonic() + 5.0
+        while True:
+            try:
+                self.conn.execute("BEGIN IMMEDIATE")
+                break
+            except sqlite3.OperationalError as e:
+                if "locked" not in str(e) and "busy" not in str(e):
+                    raise
+                if time.monotonic() + delay >= deadline:
+                    raise
+                time.sleep(delay)
+                delay = min(delay * 2, 0.1)
+        try:
+            yield self.conn
+        except Exception:
+            self.conn.rollback()
+            raise
+        else:
+            self.conn.commit()
+
     def disconnect(self):
-        """Close database connection."""
+        """Close database connections."""
         if self.conn:
             self.conn.close()
+        if self._reader_pool is not None:
+            while not self._reader_pool.empty():
+                self._reader_pool.get().close()
+            self._reader_pool = None
             
     def initialize_database(self):
         """Create database schema and populate initial data."""
-        
-        # Create Categories table
-        self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS Categories (
-                category_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                category_name VARCHAR(50) UNIQUE NOT NULL,
-                description TEXT,
-                zone VARCHAR(10) NOT NULL,
-                max_weight REAL,
-                priority_level INTEGER,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Create Locations table
-        self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS Locations (
-                location_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                location_code VARCHAR(20) UNIQUE NOT NULL,
-                zone VARCHAR(10) NOT NULL,
-                aisle INTEGER NOT NULL,
-                shelf INTEGER NOT NULL,
-                category_id INTEGER,
-                is_occupied BOOLEAN DEFAULT 0,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (category_id) REFERENCES Categories(category_id)
-            )
-        """)
-        
-        # Create Packages table
-        self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS Packages (
-                package_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                barcode VARCHAR(50) UNIQUE NOT NULL,
-                weight REAL NOT NULL,
-                length REAL NOT NULL,
-                width REAL NOT NULL,
-                height REAL NOT NULL,
-                destination VARCHAR(100) NOT NULL,
-                priority VARCHAR(20) NOT NULL,
-                category_id INTEGER NOT NULL,
-                location_id INTEGER,
-                status VARCHAR(20) DEFAULT 'Received',
-                received_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (category_id) REFERENCES Categories(category_id),
-                FOREIGN KEY (location_id) REFERENCES Locations(location_id)
-            )
-        """)
-        
-        # Create Audit Trail table
-        self.cursor.execute("""
-            CREATE TABLE IF NOT EXISTS AuditTrail (
-                audit_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                package_id INTEGER NOT NULL,
-                action VARCHAR(50) NOT NULL,
-                old_status VARCHAR(20),
-                new_status VARCHAR(20),
-                old_location VARCHAR(20),
-                new_location VARCHAR(20),
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                notes TEXT,
-                FOREIGN KEY (package_id) REFERENCES Packages(package_id)
-            )
-        """)
-        
-        # Create indexes for better performance
-        self.cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_packages_barcode 
-            ON Packages(barcode)
-        """)
-        
-        self.cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_packages_category 
-            ON Packages(category_id)
-        """)
-        
-        self.cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_locations_zone 
-            ON Locations(zone)
-        """)
-        
+        # All tables and indexes in one executescript round-trip
+        self.conn.executescript(_SCHEMA_DDL)
+
+        # Databases created before the denormalized location_code column
+        # need it added and backfilled from Locations.
+        columns = [row[1] for row in
+                   self.cursor.execute("PRAGMA table_info(Packages)")]
+        if 'location_code' not in columns:
+            self.cursor.execute("""
+                ALTER TABLE Packages ADD COLUMN location_code VARCHAR(20)
+            """)
+            self.cursor.execute("""
+                UPDATE Packages SET location_code = (
+                    SELECT location_code FROM Locations
+                    WHERE Locations.location_id = Packages.location_id
+                )
+            """)
+
         self.conn.commit()
-        
+
         # Populate initial data
         self._populate_initial_data()
         
@@ -132,19 +373,23 @@ class DistributionCenterDB:
                 VALUES (?, ?, ?, ?, ?)
             """, categories)
             
-            # Create locations for each category
-            for cat_id in range(1, 6):
-                for aisle in range(1, 6):
-                    for shelf in range(1, 5):
-                        zone = chr(64 + cat_id)  # A, B, C, D, E
-                        location_code = f"{zone}{aisle:02d}-{shelf:02d}"
-                        
-                        self.cursor.execute("""
-                            INSERT OR IGNORE INTO Locations 
-                            (location_code, zone, aisle, shelf, category_id)
-                            VALUES (?, ?, ?, ?, ?)
-                        """, (location_code, zone, aisle, shelf, cat_id))
-            
+            # Create locations for each category; zone letters are
+            # looked up from one precomputed string instead of calling
+            # chr(64 + cat_id) twice per row
+            zones = 'ABCDE'
+            locations = [
+                (f"{zones[cat_id - 1]}{aisle:02d}-{shelf:02d}",
+                 zones[cat_id - 1], aisle, shelf, cat_id)
+                for cat_id in range(1, 6)
+                for aisle in range(1, 6)
+                for shelf in range(1, 5)
+            ]
+            self.cursor.executemany("""
+                INSERT OR IGNORE INTO Locations
+                (location_code, zone, aisle, shelf, category_id)
+                VALUES (?, ?, ?, ?, ?)
+            """, locations)
+
             self.conn.commit()
         except sqlite3.IntegrityError:
             pass  # Data already exists
@@ -155,7 +400,18 @@ class PackageManager:
     
     def __init__(self, db: DistributionCenterDB):
         self.db = db
-        
+        # Categories are seeded once at initialization and never change,
+        # so resolve names from memory instead of joining on every lookup.
+        with db.reader() as conn:
+            rows = conn.execute("""
+                SELECT category_id, category_name FROM Categories
+            """).fetchall()
+        self._cat_by_id = dict(rows)
+        self._cat_by_name = {name: cat_id for cat_id, name in rows}
+        # barcode -> (cached_at, package dict); see _SEARCH_CACHE_TTL
+        self._search_cache = {}
+
+
     def categorize_package(self, weight: float, priority: str, 
                           destination: str) -> Tuple[int, str]:
         """
@@ -163,180 +419,237 @@ class PackageManager:
         
         Returns: (category_id, category_name)
         """
-        # Express priority
-        if priority.lower() == 'express':
-            return (2, 'Express')
-        
-        # International destination
-        if 'international' in destination.lower() or destination.count(',') > 1:
-            return (5, 'International')
-        
-        # Heavy items
-        if weight > 50.0:
-            return (4, 'Heavy')
-        
-        # Fragile items (can be detected by keywords or external input)
-        # For this example, we'll use a simple check
-        if weight < 5.0:
-            return (3, 'Fragile')
-        
-        # Default to Standard
-        return (1, 'Standard')
+        return _categorize(weight, priority.lower(), destination)
     
     def find_available_location(self, category_id: int) -> Optional[int]:
         """Find an available location for the given category."""
-        self.db.cursor.execute("""
-            SELECT location_id FROM Locations
-            WHERE category_id = ? AND is_occupied = 0
-            LIMIT 1
-        """, (category_id,))
-        
-        result = self.db.cursor.fetchone()
+        with self.db.reader() as conn:
+            result = conn.execute(_SQL_FIND_LOCATION, (category_id,)).fetchone()
         return result[0] if result else None
-    
-    
-        
-    
+
+    def register_package(self, barcode: str, weight: float, length: float,
+                         width: float, height: float, destination: str,
+                         priority: str) -> bool:
+        """
+        Register a new package and assign it a storage location.
+
+        The location lookup and the occupancy update are fused into one
+        UPDATE ... RETURNING statement, and duplicate barcodes are caught
+        through the UNIQUE constraint instead of a separate SELECT, so
+        registration needs 3 statements instead of 5.
+        """
+        category_id, category_name = self.categorize_package(
+            weight, priority, destination)
+
+        try:
+            with self.db.writer() as conn:
+                # Claim a free location and get its code in one statement
+                location = conn.execute(_SQL_CLAIM_LOCATION,
+                                        (category_id,)).fetchone()
+
+                if location is None:
+                    print(f"❌ No available locations in category {category_name}!")
+                    return False
+
+                location_id, location_code = location
+
+                cursor = conn.execute(_SQL_INSERT_PACKAGE,
+                                      (barcode, weight, length, width, height,
+                                       destination, priority, category_id,
+                                       location_id, location_code))
+
+                conn.execute(_SQL_INSERT_AUDIT_REGISTER,
+                             (cursor.lastrowid, location_code,
+                              f"Package stored at {location_code}"))
+
+            self._search_cache.pop(barcode, None)
+            print(f"✅ Package registered successfully!")
+            print(f"   Category: {category_name}")
+            print(f"   Location: {location_code}")
+            return True
+
+        except sqlite3.IntegrityError:
+            print(f"❌ Package with barcode {barcode} already exists!")
+            return False
+        except sqlite3.Error as e:
+            print(f"❌ Database error: {e}")
+            return False
+
+    def register_packages_bulk(self, rows: List[Tuple]) -> int:
+        """
+        Register many packages in a single transaction.
+
+        Each row is (barcode, weight, length, width, height, destination,
+        priority). Returns the number of packages registered.
+
+        One BEGIN IMMEDIATE + one commit amortizes the fsync over the
+        whole batch, and executemany reuses each prepared statement
+        instead of re-parsing it per row.
+        """
+        try:
+            with self.db.writer() as conn:
+                # Pre-fetch all free locations, grouped by category
+                free_locations = {}
+                for location_id, location_code, category_id in conn.execute("""
+                    SELECT location_id, location_code, category_id
+                    FROM Locations
+                    WHERE is_occupied = 0
+                    ORDER BY category_id
+                """).fetchall():
+                    free_locations.setdefault(category_id, []).append(
+                        (location_id, location_code))
+
+                package_rows = []
+                location_ids = []
+                codes_by_barcode = {}
+                for barcode, weight, length, width, height, destination, priority in rows:
+                    category_id, category_name = self.categorize_package(
+                        weight, priority, destination)
+
+                    available = free_locations.get(category_id)
+                    if not available:
+                        print(f"❌ No available locations in category {category_name}!")
+                        continue
+
+                    location_id, location_code = available.pop(0)
+                    package_rows.append((barcode, weight, length, width, height,
+                                         destination, priority, category_id,
+                                         location_id, location_code))
+                    location_ids.append((location_id,))
+                    codes_by_barcode[barcode] = location_code
+
+                if not package_rows:
+                    return 0
+
+                conn.executemany(_SQL_INSERT_PACKAGE, package_rows)
+
+                conn.executemany("""
+                    UPDATE Locations SET is_occupied = 1 WHERE location_id = ?
+                """, location_ids)
+
+                # Audit rows need the package_ids generated by the INSERT
+                placeholders = ','.join('?' * len(codes_by_barcode))
+                id_rows = conn.execute(f"""
+                    SELECT package_id, barcode FROM Packages
+                    WHERE barcode IN ({placeholders})
+                """, list(codes_by_barcode)).fetchall()
+
+                conn.executemany(_SQL_INSERT_AUDIT_REGISTER,
+                                 [(package_id, codes_by_barcode[barcode],
+                                   f"Package stored at {codes_by_barcode[barcode]}")
+                                  for package_id, barcode in id_rows])
+
+            for barcode in codes_by_barcode:
+                self._search_cache.pop(barcode, None)
+            return len(package_rows)
+
+        except sqlite3.Error as e:
+            print(f"❌ Database error: {e}")
+            return 0
+
     def search_package(self, barcode: str) -> Optional[dict]:
         """Search for a package by barcode."""
-        self.db.cursor.execute("""
-            SELECT 
-                p.package_id, p.barcode, p.weight, p.length, p.width, p.height,
-                p.destination, p.priority, p.status, p.received_at,
-                c.category_name, l.location_code
-            FROM Packages p
-            JOIN Categories c ON p.category_id = c.category_id
-            LEFT JOIN Locations l ON p.location_id = l.location_id
-            WHERE p.barcode = ?
-        """, (barcode,))
-        
-        result = self.db.cursor.fetchone()
+        cached = self._search_cache.get(barcode)
+        if cached is not None:
+            cached_at, package = cached
+            if time.monotonic() - cached_at < _SEARCH_CACHE_TTL:
+                return package
+            del self._search_cache[barcode]
+
+        with self.db.reader() as conn:
+            result = conn.execute(_SQL_SEARCH_PACKAGE, (barcode,)).fetchone()
         
         if not result:
             return None
-        
-        return {
-            'package_id': result[0],
-            'barcode': result[1],
-            'weight': result[2],
-            'dimensions': f"{result[3]}x{result[4]}x{result[5]}",
-            'destination': result[6],
-            'priority': result[7],
-            'status': result[8],
-            'received_at': result[9],
-            'category': result[10],
-            'location': result[11]
-        }
+
+        # sqlite3.Row gives name-indexed access; SQL already composed
+        # the dimensions string, so only the category needs resolving.
+        package = dict(result)
+        package['category'] = self._cat_by_id.get(
+            package.pop('category_id'), 'Unknown')
+        self._search_cache[barcode] = (time.monotonic(), package)
+        return package
     
     def update_package_status(self, barcode: str, new_status: str) -> bool:
         """Update package status."""
         try:
-            # Get current package info
-            package = self.search_package(barcode)
-            if not package:
+            # Only the id and current status are needed here, so use a
+            # narrow barcode-indexed lookup instead of search_package
+            with self.db.reader() as conn:
+                row = conn.execute(_SQL_GET_STATUS, (barcode,)).fetchone()
+
+            if not row:
                 print(f"❌ Package {barcode} not found!")
                 return False
-            
-            old_status = package['status']
-            
-            # Update status
-            self.db.cursor.execute("""
-                UPDATE Packages SET status = ? WHERE barcode = ?
-            """, (new_status, barcode))
-            
-            # If status is delivered, free up location
-            if new_status.lower() == 'delivered':
-                self.db.cursor.execute("""
-                    UPDATE Locations SET is_occupied = 0
-                    WHERE location_id = (
-                        SELECT location_id FROM Packages WHERE barcode = ?
-                    )
-                """, (barcode,))
-            
-            # Create audit trail
-            self.db.cursor.execute("""
-                INSERT INTO AuditTrail 
-                (package_id, action, old_status, new_status, notes)
-                VALUES (?, 'STATUS_UPDATE', ?, ?, ?)
-            """, (package['package_id'], old_status, new_status,
-                    f"Status changed from {old_status} to {new_status}"))
-            
-            self.db.conn.commit()
+
+            package_id, old_status = row
+
+            with self.db.writer() as conn:
+                # Update status
+                conn.execute(_SQL_UPDATE_STATUS, (new_status, barcode))
+
+                # If status is delivered, free up location
+                if new_status.lower() == 'delivered':
+                    conn.execute(_SQL_FREE_LOCATION, (barcode,))
+
+                # Create audit trail
+                conn.execute(_SQL_INSERT_AUDIT_STATUS,
+                             (package_id, old_status, new_status,
+                              f"Status changed from {old_status} to {new_status}"))
+
+            self._search_cache.pop(barcode, None)
             print(f"✅ Package status updated: {old_status} → {new_status}")
             return True
-            
+
         except sqlite3.Error as e:
             print(f"❌ Database error: {e}")
-            self.db.conn.rollback()
             return False
     
     def get_summary_report(self) -> dict:
         """Generate summary statistics."""
-        report = {}
-        
-        # Packages by category
-        self.db.cursor.execute("""
-            SELECT c.category_name, COUNT(p.package_id) as count
-            FROM Categories c
-            LEFT JOIN Packages p ON c.category_id = p.category_id
-            GROUP BY c.category_id, c.category_name
-            ORDER BY count DESC
-        """)
-        report['by_category'] = self.db.cursor.fetchall()
-        
-        # Packages by status
-        #self.db.cursor.execute("""
-        #    SELECT status, COUNT(*) as count
-        #    FROM Packages
-         #   GROUP BY status
-       # """)
-       # report['by_status'] = self.db.cursor.fetchall()
-        
-# Filtramos para mostrar solo los estados válidos oficiales.
-        self.db.cursor.execute("""
-            SELECT status, COUNT(*) as count
-            FROM Packages
-            WHERE status IN ('Received', 'Stored', 'In Transit', 'Delivered')
-            GROUP BY status
-        """)
-        
-        report['by_status'] = self.db.cursor.fetchall()
+        report = {
+            'by_category': [],
+            'by_status': [],
+            'location_occupancy': [],
+        }
 
+        with self.db.reader() as conn:
+            cursor = conn.cursor()
+            cursor.arraysize = 100
 
+            # Category, status and occupancy aggregates in one query;
+            # only the statuses válidos oficiales are counted. Iterating
+            # the cursor streams rows instead of materializing an
+            # intermediate list first.
+            cursor.execute(_SQL_SUMMARY_AGGREGATES)
+            category_counts = {}
+            for tag, key, count, occupied, rate in cursor:
+                if tag == 'category':
+                    category_counts[key] = count
+                elif tag == 'status':
+                    report['by_status'].append((key, count))
+                else:
+                    report['location_occupancy'].append(
+                        (key, count, occupied, rate))
 
+            # Resolve names from the cache; categories without packages
+            # still show up with a zero count.
+            report['by_category'] = sorted(
+                ((name, category_counts.get(cat_id, 0))
+                 for cat_id, name in self._cat_by_id.items()),
+                key=lambda row: row[1], reverse=True)
+
+            # Recent activities (different row shape, kept separate)
+            cursor.execute(_SQL_RECENT_ACTIVITIES)
+            report['recent_activities'] = list(cursor)
 
-        # Location occupancy
-        self.db.cursor.execute("""
-            SELECT 
-                zone,
-                COUNT(*) as total_locations,
-                SUM(CASE WHEN is_occupied = 1 THEN 1 ELSE 0 END) as occupied,
-                ROUND(SUM(CASE WHEN is_occupied = 1 THEN 1 ELSE 0 END) * 100.0 / COUNT(*), 2) as occupancy_rate
-            FROM Locations
-            GROUP BY zone
-        """)
-        report['location_occupancy'] = self.db.cursor.fetchall()
-        
-        # Recent activities
-        self.db.cursor.execute("""
-            SELECT 
-                p.barcode,
-                a.action,
-                a.timestamp,
-                a.notes
-            FROM AuditTrail a
-            JOIN Packages p ON a.package_id = p.package_id
-            ORDER BY a.timestamp DESC
-            LIMIT 10
-        """)
-        report['recent_activities'] = self.db.cursor.fetchall()
-        
         return report
 
 
 def generate_random_barcode() -> str:
-    """Generate a random barcode for testing."""
-    return ''.join(random.choices(string.digits, k=12))
+    """Generate a random 12-digit barcode for testing."""
+    # One RNG call and one format op instead of twelve draws + join
+    return f"{random.randint(0, 999_999_999_999):012d}"
 
 
 def display_menu():
@@ -381,7 +694,6 @@ def display_menu():
 # CON LAS VALIDACIONES SOLICITADAS
 def register_package_ui(manager: PackageManager):
     """User interface for package registration."""
-    import re  # Necesario para validar caracteres especiales
     print("\n--- REGISTER NEW PACKAGE ---")
     
     barcode = input("Enter barcode (or press Enter to generate random): ").strip()
@@ -433,16 +745,19 @@ def search_package_ui(manager: PackageManager):
     package = manager.search_package(barcode)
     
     if package:
-        print("\n📦 Package Details:")
-        print(f"   Barcode:     {package['barcode']}")
-        print(f"   Category:    {package['category']}")
-        print(f"   Location:    {package['location']}")
-        print(f"   Weight:      {package['weight']} kg")
-        print(f"   Dimensions:  {package['dimensions']} cm")
-        print(f"   Destination: {package['destination']}")
-        print(f"   Priority:    {package['priority']}")
-        print(f"   Status:      {package['status']}")
-        print(f"   Received:    {package['received_at']}")
+        # One buffered write instead of a syscall per line
+        sys.stdout.write("\n".join([
+            "\n📦 Package Details:",
+            f"   Barcode:     {package['barcode']}",
+            f"   Category:    {package['category']}",
+            f"   Location:    {package['location']}",
+            f"   Weight:      {package['weight']} kg",
+            f"   Dimensions:  {package['dimensions']} cm",
+            f"   Destination: {package['destination']}",
+            f"   Priority:    {package['priority']}",
+            f"   Status:      {package['status']}",
+            f"   Received:    {package['received_at']}",
+        ]) + "\n")
     else:
         print(f"❌ Package with barcode {barcode} not found!")
 
@@ -480,29 +795,34 @@ def update_status_ui(manager: PackageManager):
 
 def display_report(manager: PackageManager):
     """Display summary report."""
-    print("\n" + "="*60)
-    print("                    SUMMARY REPORT")
-    print("="*60)
-    
     report = manager.get_summary_report()
-    
-    print("\n📊 Packages by Category:")
+
+    # Accumulate the whole report and emit it in one buffered write
+    # instead of a syscall per print
+    lines = [
+        "\n" + "="*60,
+        "                    SUMMARY REPORT",
+        "="*60,
+        "\n📊 Packages by Category:",
+    ]
     for category, count in report['by_category']:
-        print(f"   {category:15s}: {count:3d} packages")
-    
-    print("\n📋 Packages by Status:")
+        lines.append(f"   {category:15s}: {count:3d} packages")
+
+    lines.append("\n📋 Packages by Status:")
     for status, count in report['by_status']:
-        print(f"   {status:15s}: {count:3d} packages")
-    
-    print("\n🏢 Location Occupancy by Zone:")
+        lines.append(f"   {status:15s}: {count:3d} packages")
+
+    lines.append("\n🏢 Location Occupancy by Zone:")
     for zone, total, occupied, rate in report['location_occupancy']:
-        print(f"   Zone {zone}: {occupied}/{total} ({rate}% occupied)")
-    
-    print("\n📝 Recent Activities:")
+        lines.append(f"   Zone {zone}: {occupied}/{total} ({rate}% occupied)")
+
+    lines.append("\n📝 Recent Activities:")
     for barcode, action, timestamp, notes in report['recent_activities']:
-        print(f"   [{timestamp}] {barcode} - {action}")
+        lines.append(f"   [{timestamp}] {barcode} - {action}")
         if notes:
-            print(f"      → {notes}")
+            lines.append(f"      → {notes}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def generate_sample_packages(manager: PackageManager):
@@ -519,12 +839,10 @@ def generate_sample_packages(manager: PackageManager):
         (100.0, 80, 60, 50, "Seattle, USA", "Standard"),
     ]
     
-    for weight, length, width, height, destination, priority in samples:
-        barcode = generate_random_barcode()
-        manager.register_package(barcode, weight, length, width, height,
-                                destination, priority)
-    
-    print(f"\n✅ Generated {len(samples)} sample packages!")
+    rows = [(generate_random_barcode(),) + sample for sample in samples]
+    registered = manager.register_packages_bulk(rows)
+
+    print(f"\n✅ Generated {registered} sample packages!")
 
 
 def main():